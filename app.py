@@ -2,11 +2,16 @@ from flask import Flask, render_template, jsonify, request
 import docker
 import socket
 import logging
-import json
+import orjson
+import copy
 import os
+import tempfile
 import time
 import threading
-from datetime import datetime
+import random
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -17,12 +22,27 @@ app = Flask(__name__)
 # --- Configuration Setup ---
 CONFIG_DIR = "/app/config"
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
+CACHE_FILE = os.path.join(CONFIG_DIR, "cache.json")
+CACHE_PERSIST_DELAY = 5  # Seconds to batch cache writes before flushing to disk
 
 os.makedirs(CONFIG_DIR, exist_ok=True)
 
 # Global Cache
+# Only single-key get/set/pop are used on this dict. Those are atomic under the
+# GIL, so no lock is needed; take dict(SERVER_CACHE) when a consistent snapshot
+# of several entries is required.
 SERVER_CACHE = {}
-CACHE_LOCK = threading.Lock()
+
+# Pending debounced write of SERVER_CACHE, see schedule_cache_persist()
+_PERSIST_TIMER = None
+_PERSIST_LOCK = threading.Lock()
+
+# Image ID -> first tag ("" if untagged), see get_image_name()
+_IMAGE_NAME_CACHE = {}
+
+# Parsed config, reused until the file's mtime changes
+_CONFIG_CACHE = {"mtime": None, "data": None}
+_CONFIG_LOCK = threading.Lock()
 
 # Default settings
 DEFAULT_CONFIG = {
@@ -35,42 +55,214 @@ DEFAULT_CONFIG = {
 }
 
 # Docker Setup
+CHECK_WORKERS = 8          # Parallel registry checks per background cycle
+DOCKER_POOL_SIZE = 32      # Must exceed CHECK_WORKERS plus concurrent API requests
+
 try:
-    client = docker.from_env()
+    client = docker.from_env(max_pool_size=DOCKER_POOL_SIZE)
 except Exception as e:
     logger.error(f"Failed to connect to Docker Socket: {e}")
     client = None
 
 UPDATER_IMAGE = "containrrr/watchtower"
+UPDATER_PULL_INTERVAL = 86400  # Re-pull the updater image at most once a day
+_LAST_UPDATER_PULL = 0.0
+IGNORE_IMAGE_PREFIXES = (UPDATER_IMAGE, "docker.io/" + UPDATER_IMAGE)  # Never list or check these
+UPDATER_LABEL = "com.centurylinklabs.watchtower"  # Set by the Watchtower image itself
+
+# Hostname is fixed for the container's lifetime
+CURRENT_HOSTNAME = socket.gethostname()
+_UNRESOLVED = object()
+_SELF_CONTAINER_ID = _UNRESOLVED  # See get_self_container_id()
 
 # --- Helper Functions ---
 
 def load_config():
-    """Loads configuration from JSON file or returns defaults."""
-    if not os.path.exists(CONFIG_FILE):
+    """Loads configuration from JSON file or returns defaults.
+
+    The parsed file is cached and only re-read when its mtime changes.
+    Callers get their own copy, so mutating the result is safe.
+    """
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return DEFAULT_CONFIG.copy()
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
         return DEFAULT_CONFIG.copy()
+
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE["mtime"] == mtime:
+            return copy.deepcopy(_CONFIG_CACHE["data"])
+
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return {**DEFAULT_CONFIG, **json.load(f)}
+        with open(CONFIG_FILE, 'rb') as f:
+            data = {**DEFAULT_CONFIG, **orjson.loads(f.read())}
     except Exception as e:
         logger.error(f"Error loading config: {e}")
         return DEFAULT_CONFIG.copy()
 
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE["mtime"] = mtime
+        _CONFIG_CACHE["data"] = data
+    return copy.deepcopy(data)
+
+def atomic_write(path, data):
+    """Write bytes to a temp file and rename it over path, so concurrent
+    readers never see a partially written file."""
+    # Unique temp name per call, so concurrent writers never share a file
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            os.fchmod(f.fileno(), 0o644)  # mkstemp creates 0600; keep files readable on the host
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
 def save_config(config):
     """Saves configuration to JSON file."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        atomic_write(CONFIG_FILE, orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        # Prime the cache so the next load doesn't re-parse what we just wrote
+        with _CONFIG_LOCK:
+            _CONFIG_CACHE["mtime"] = os.stat(CONFIG_FILE).st_mtime_ns
+            _CONFIG_CACHE["data"] = {**DEFAULT_CONFIG, **copy.deepcopy(config)}
         return True
     except Exception as e:
         logger.error(f"Error saving config: {e}")
         return False
 
+def get_check_interval(config):
+    """Check interval in minutes, falling back to the default for invalid values."""
+    try:
+        return int(config.get('check_interval'))
+    except (TypeError, ValueError):
+        return DEFAULT_CONFIG['check_interval']
+
+def load_server_cache():
+    """Restore check results from disk, dropping entries older than the check interval.
+
+    Runs at import time, so any failure is logged and the cache starts empty.
+    """
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            stored = orjson.loads(f.read())
+        if not isinstance(stored, dict):
+            raise ValueError("cache file is not a JSON object")
+        max_age = get_check_interval(load_config()) * 60
+        now = time.time()
+        for container_id, result in stored.items():
+            if not isinstance(result, dict):
+                continue
+            checked_at_ts = result.get('checked_at_ts')
+            if isinstance(checked_at_ts, (int, float)) and now - checked_at_ts < max_age:
+                SERVER_CACHE[container_id] = result
+        logger.info("Restored %d cached check results", len(SERVER_CACHE))
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        logger.warning("Could not load check cache: %s", e)
+
+def persist_cache():
+    """Write a snapshot of SERVER_CACHE to disk."""
+    global _PERSIST_TIMER
+    with _PERSIST_LOCK:
+        _PERSIST_TIMER = None
+    try:
+        atomic_write(CACHE_FILE, orjson.dumps(dict(SERVER_CACHE)))
+    except Exception as e:
+        logger.warning("Could not persist check cache: %s", e)
+
+def schedule_cache_persist():
+    """Persist SERVER_CACHE after a short delay, batching bursts of check results."""
+    global _PERSIST_TIMER
+    with _PERSIST_LOCK:
+        if _PERSIST_TIMER is None:
+            _PERSIST_TIMER = threading.Timer(CACHE_PERSIST_DELAY, persist_cache)
+            _PERSIST_TIMER.daemon = True
+            _PERSIST_TIMER.start()
+
+def json_response(obj):
+    """JSON response serialized with orjson, for payloads that scale with container count."""
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+def serialize_result(result):
+    """Copy of a cached check result with 'checked_at' formatted as ISO string."""
+    if result is None:
+        return None
+    return {**result, 'checked_at': datetime.fromtimestamp(result['checked_at_ts'], tz=timezone.utc).isoformat()}
+
+def is_updater_container(labels):
+    """True if the container's labels mark it as a Watchtower instance."""
+    return (labels or {}).get(UPDATER_LABEL) == "true"
+
+def get_raw_image_name(raw):
+    """Image name for a raw client.api.containers() entry.
+
+    The daemon reports the image ID in 'Image' once the tag no longer points
+    to the container's image. Only those entries are resolved via the image's
+    tags or the container's Config.Image, like for Container objects.
+    """
+    image = raw.get('Image') or ''
+    if image and not image.startswith('sha256:'):
+        return image
+    try:
+        image_id = raw.get('ImageID') or image
+        tag = _IMAGE_NAME_CACHE.get(image_id) if image_id else None
+        if tag is None and image_id:
+            tags = client.images.get(image_id).tags
+            tag = tags[0] if tags else ""
+            _IMAGE_NAME_CACHE[image_id] = tag
+        if tag:
+            return tag
+        image_config = client.api.inspect_container(raw['Id']).get('Config', {}).get('Image', '')
+        return image_config or "unknown-image"
+    except Exception as e:
+        return "unknown"
+
+def get_self_container_id():
+    """ID of the container this app runs in, or None if it can't be found.
+
+    Matched by Config.Hostname like the background worker does, so custom
+    compose hostnames and network_mode: host still work. The ID can't change
+    without restarting this process, so a successful lookup is memoized.
+    """
+    global _SELF_CONTAINER_ID
+    if _SELF_CONTAINER_ID is _UNRESOLVED:
+        self_id = None
+        for c in client.containers.list():
+            if c.attrs.get('Config', {}).get('Hostname', '') == CURRENT_HOSTNAME:
+                self_id = c.id
+                break
+        _SELF_CONTAINER_ID = self_id
+    return _SELF_CONTAINER_ID
+
 def get_image_name(container):
-    """Robustly retrieve the image name."""
+    """Robustly retrieve the image name.
+
+    Accepts a Container object or a raw dict from client.api.containers().
+    """
+    if isinstance(container, dict):
+        return get_raw_image_name(container)
     try:
-        if container.image.tags:
-            return container.image.tags[0]
+        # attrs['Image'] is the immutable image ID, so its first tag can be memoized
+        # instead of inspecting the image on every call
+        image_id = container.attrs.get('Image')
+        tag = _IMAGE_NAME_CACHE.get(image_id) if image_id else None
+        if tag is None:
+            tags = container.image.tags
+            tag = tags[0] if tags else ""
+            if image_id:
+                _IMAGE_NAME_CACHE[image_id] = tag
+        if tag:
+            return tag
         image_config = container.attrs.get('Config', {}).get('Image', '')
         if image_config:
             return image_config
@@ -78,10 +270,42 @@ def get_image_name(container):
     except Exception as e:
         return "unknown"
 
-def perform_single_check(container_id):
+def get_check_ttl():
+    """Seconds a cached check result stays fresh (half the check interval)."""
+    return get_check_interval(load_config()) * 60 / 2
+
+def pull_latest(image_name, local_digests=()):
+    """Pull an image via the streaming API.
+
+    Returns True if the pulled digest is one of local_digests, i.e. the
+    container's own image is already the latest, and stops reading the stream
+    there. Otherwise reads the pull to completion and returns False; the caller
+    then has to compare the tag's image ID with the container's image.
+    The Digest line arrives after the layers, so this saves little bandwidth.
+    """
+    stream = client.api.pull(image_name, stream=True, decode=True)
+    try:
+        for event in stream:
+            if 'error' in event:
+                raise docker.errors.APIError(event['error'])
+            status = event.get('status', '')
+            if status.startswith('Digest:') and status.split(':', 1)[1].strip() in local_digests:
+                return True
+        return False
+    finally:
+        stream.close()
+
+def perform_single_check(container_id, force=False):
     """
     Performs the update check logic for a single container.
+    Returns the cached result if it is still within the TTL, unless force is set.
     """
+    if not force:
+        cached = SERVER_CACHE.get(container_id)
+        if cached and time.time() - cached.get('checked_at_ts', 0) < get_check_ttl():
+            logger.debug("Using cached check result for %s", container_id)
+            return cached
+
     container = client.containers.get(container_id)
     current_img = container.image
     current_id = current_img.id
@@ -98,43 +322,81 @@ def perform_single_check(container_id):
     update_available = False
     is_local = False
 
-    # Try to pull latest image
-    try:
-        new_img = client.images.pull(image_name)
-        new_id = new_img.id
-        new_created = new_img.attrs.get('Created', 'Unknown')
-        update_available = new_id != current_id
-        
-    except (docker.errors.NotFound, docker.errors.APIError):
-        is_local = True
-        logger.info(f"Local detection: '{image_name}' not found on registry. Treating as local image.")
-    except Exception as e:
-        raise e
+    # Compare the remote manifest digest against the local repo digests.
+    # This only fetches the manifest, no layers are downloaded.
+    repo_digests = current_img.attrs.get('RepoDigests') or []
+    local_digests = [d.split('@', 1)[-1] for d in repo_digests]
+    current_display_id = current_id
+    use_pull = not local_digests
+    if not use_pull:
+        try:
+            registry_data = client.images.get_registry_data(image_name)
+            new_id = registry_data.id
+            update_available = new_id not in local_digests
+            # Show a digest next to the remote digest, not the image ID.
+            # Prefer the one for the repository the container was started from.
+            repo = image_name.split('@', 1)[0]
+            if ':' in repo.rsplit('/', 1)[-1]:
+                repo = repo.rsplit(':', 1)[0]
+            current_display_id = next(
+                (d.split('@', 1)[-1] for d in repo_digests if d.split('@', 1)[0] == repo),
+                local_digests[0]
+            )
+        except docker.errors.APIError:
+            # Registry may not support manifest lookups, fall back to a full pull
+            use_pull = True
+            new_id = None
+
+    # Fallback: pull latest image and compare image IDs
+    if use_pull:
+        try:
+            if pull_latest(image_name, local_digests):
+                new_id = current_id
+                new_created = current_created
+            else:
+                new_img = client.images.get(image_name)
+                new_id = new_img.id
+                new_created = new_img.attrs.get('Created', 'Unknown')
+            update_available = new_id != current_id
+            if update_available:
+                # Pulling moved the tag from the old image to the new one
+                _IMAGE_NAME_CACHE.pop(current_id, None)
+                _IMAGE_NAME_CACHE.pop(new_id, None)
+
+        except (docker.errors.NotFound, docker.errors.APIError):
+            is_local = True
+            logger.info("Local detection: '%s' not found on registry. Treating as local image.", image_name)
+        except Exception as e:
+            raise e
 
     result = {
         'update_available': update_available,
         'is_local': is_local,
-        'current_id_short': current_id.split(':')[-1][:12],
+        'current_id_short': current_display_id.split(':')[-1][:12],
         'new_id_short': new_id.split(':')[-1][:12] if new_id else "n/a",
         'current_created': current_created,
         'new_created': new_created if new_created else "n/a",
-        'checked_at': datetime.now().isoformat()
+        'checked_at_ts': time.time()
     }
     
-    with CACHE_LOCK:
-        SERVER_CACHE[container_id] = result
-        
+    SERVER_CACHE[container_id] = result
+    schedule_cache_persist()
+
     return result
 
 def trigger_updater_engine(container_name, old_image_id=None):
     """Triggers the external updater engine (Watchtower)."""
+    global _LAST_UPDATER_PULL
 
-    # 1. FIX: Ensure we have the LATEST Watchtower image to avoid old API clients
-    try:
-        logger.info(f"Pulling latest updater image: {UPDATER_IMAGE}")
-        client.images.pull(UPDATER_IMAGE)
-    except Exception as e:
-        logger.warning(f"Could not pull latest updater image, using local cache: {e}")
+    # 1. FIX: Ensure we have the LATEST Watchtower image to avoid old API clients.
+    # Skip the pull if it was refreshed recently.
+    if time.time() - _LAST_UPDATER_PULL > UPDATER_PULL_INTERVAL:
+        try:
+            logger.info(f"Pulling latest updater image: {UPDATER_IMAGE}")
+            client.images.pull(UPDATER_IMAGE)
+            _LAST_UPDATER_PULL = time.time()
+        except Exception as e:
+            logger.warning(f"Could not pull latest updater image, using local cache: {e}")
 
     # 2. FIX: Force newer API version via Environment Variable
     client.containers.run(
@@ -313,20 +575,50 @@ def restart_collected_dependents(dependents, updated_name):
 
 # --- Background Worker ---
 
+# Set to wake the worker early, e.g. after settings were changed
+_WAKE = threading.Event()
+# Set to make the worker exit at its next wakeup
+_STOP = threading.Event()
+WORKER_IDLE_DELAY = 300  # Re-read config this often when not in background mode
+WORKER_MIN_DELAY = 10    # Lower bound between cycles, e.g. when a cycle failed
+WORKER_MAX_BACKOFF = 60  # Cap for the retry delay after worker errors
+WORKER_STOP_TIMEOUT = 10 # Seconds to wait for the worker on shutdown
+
+def compute_next_delay(last_check_time, interval_seconds):
+    """Seconds until the next scheduled background cycle."""
+    return max(WORKER_MIN_DELAY, interval_seconds - (time.time() - last_check_time))
+
+def compute_error_backoff(err_count):
+    """Exponential backoff with jitter, so restarted instances don't retry in lockstep."""
+    return min(WORKER_MAX_BACKOFF, 2 ** err_count) + random.uniform(0, 5)
+
+def stop_background_worker():
+    """Signal the background worker to exit and wait briefly for it.
+
+    The worker finishes the update it is running, but starts no new ones.
+    """
+    _STOP.set()
+    _WAKE.set()
+    worker_thread.join(timeout=WORKER_STOP_TIMEOUT)
+
 def background_worker():
     """
     Runs in a separate thread. Checks config and performs updates if enabled.
+    Sleeps until the next scheduled cycle or until woken via _WAKE.
     """
     logger.info("Background worker started.")
     last_check_time = 0
+    err_count = 0
 
-    while True:
+    while not _STOP.is_set():
         try:
+            next_delay = WORKER_IDLE_DELAY
+            retry_delay = None
             config = load_config()
             mode = config.get('check_mode', 'manual')
             
             if mode == 'background':
-                interval_minutes = int(config.get('check_interval', 60))
+                interval_minutes = get_check_interval(config)
                 interval_seconds = interval_minutes * 60
                 
                 if (time.time() - last_check_time) >= interval_seconds:
@@ -334,45 +626,58 @@ def background_worker():
                     
                     try:
                         containers = client.containers.list()
-                        current_hostname = socket.gethostname()
                         
                         auto_up_mode = config.get('auto_update_mode', 'off')
                         auto_up_list = config.get('auto_update_containers', [])
                         
                         self_container = None
+                        to_check = []
                         for c in containers:
+                            if is_updater_container(c.labels): continue
                             image_name = get_image_name(c)
-                            if "watchtower" in image_name: continue
-                            if c.attrs.get('Config', {}).get('Hostname', '') == current_hostname:
+                            if image_name.startswith(IGNORE_IMAGE_PREFIXES): continue
+                            if c.attrs.get('Config', {}).get('Hostname', '') == CURRENT_HOSTNAME:
                                 self_container = c
                                 continue  # process self last
-
-                            try:
-                                result = perform_single_check(c.id)
-
-                                if result['update_available'] and not result.get('is_local', False):
-                                    should_update = False
-                                    if auto_up_mode == 'all':
-                                        should_update = True
-                                    elif auto_up_mode == 'selected' and c.name in auto_up_list:
-                                        should_update = True
-
-                                    if should_update:
-                                        logger.info(f"Auto-Update triggered for {c.name}")
-                                        saved_id = c.id
-                                        dependents = collect_dependents_if_enabled(saved_id, c.name)
-                                        trigger_updater_engine(c.name, c.image.id)
-                                        restart_collected_dependents(dependents, c.name)
-                                        with CACHE_LOCK:
-                                            if saved_id in SERVER_CACHE: del SERVER_CACHE[saved_id]
-
-                            except Exception as inner_e:
-                                logger.warning(f"Failed to process {c.name}: {inner_e}")
+                            to_check.append(c)
+
+                        # Registry lookups are network-bound, so run them concurrently.
+                        # Updates are still triggered one at a time from this thread,
+                        # since parallel Watchtower runs against the same socket can race.
+                        with ThreadPoolExecutor(max_workers=CHECK_WORKERS) as executor:
+                            futures = {executor.submit(perform_single_check, c.id): c for c in to_check}
+                            self_future = executor.submit(perform_single_check, self_container.id) if self_container else None
+
+                            for future in as_completed(futures):
+                                if _STOP.is_set():
+                                    break
+                                c = futures[future]
+                                try:
+                                    result = future.result()
+
+                                    if result['update_available'] and not result.get('is_local', False):
+                                        should_update = False
+                                        if auto_up_mode == 'all':
+                                            should_update = True
+                                        elif auto_up_mode == 'selected' and c.name in auto_up_list:
+                                            should_update = True
+
+                                        if should_update:
+                                            logger.info("Auto-Update triggered for %s", c.name)
+                                            saved_id = c.id
+                                            dependents = collect_dependents_if_enabled(saved_id, c.name)
+                                            trigger_updater_engine(c.name, c.image.id)
+                                            restart_collected_dependents(dependents, c.name)
+                                            SERVER_CACHE.pop(saved_id, None)
+                                            schedule_cache_persist()
+
+                                except Exception as inner_e:
+                                    logger.warning("Failed to process %s: %s", c.name, inner_e)
 
                         # Handle self last so all other containers update first
-                        if self_container:
+                        if self_container and not _STOP.is_set():
                             try:
-                                result = perform_single_check(self_container.id)
+                                result = self_future.result()
                                 if result['update_available'] and not result.get('is_local', False):
                                     should_update = False
                                     if auto_up_mode == 'all':
@@ -380,28 +685,44 @@ def background_worker():
                                     elif auto_up_mode == 'selected' and self_container.name in auto_up_list:
                                         should_update = True
                                     if should_update:
-                                        logger.info(f"Auto-Update triggered for self: {self_container.name}")
+                                        logger.info("Auto-Update triggered for self: %s", self_container.name)
                                         saved_self_id = self_container.id
                                         dependents = collect_dependents_if_enabled(saved_self_id, self_container.name)
                                         trigger_updater_engine(self_container.name, self_container.image.id)
                                         restart_collected_dependents(dependents, self_container.name)
                             except Exception as inner_e:
-                                logger.warning(f"Failed to process self container: {inner_e}")
-                        
+                                logger.warning("Failed to process self container: %s", inner_e)
+
                         last_check_time = time.time()
                         logger.info("Background cycle finished.")
-                        
+
                     except Exception as e:
-                        logger.error(f"Error during container loop: {e}")
+                        # Typically the daemon being unreachable, e.g. while it restarts
+                        err_count += 1
+                        retry_delay = compute_error_backoff(err_count)
+                        logger.error("Error during container loop: %s (retrying in %.0fs)", e, retry_delay)
+
+                next_delay = retry_delay if retry_delay is not None else compute_next_delay(last_check_time, interval_seconds)
+
+            if retry_delay is None:
+                err_count = 0
+            _WAKE.wait(timeout=next_delay)
+            _WAKE.clear()
 
-            time.sleep(10)
-            
         except Exception as outer_e:
-            logger.error(f"Critical worker error: {outer_e}")
-            time.sleep(60)
+            err_count += 1
+            backoff = compute_error_backoff(err_count)
+            logger.error("Critical worker error: %s (retrying in %.0fs)", outer_e, backoff)
+            _WAKE.wait(timeout=backoff)
+            _WAKE.clear()
+
+    logger.info("Background worker stopped.")
+
+load_server_cache()
 
 worker_thread = threading.Thread(target=background_worker, daemon=True)
 worker_thread.start()
+atexit.register(stop_background_worker)
 
 # --- Routes ---
 
@@ -422,6 +743,7 @@ def update_settings():
         if key in new_settings:
             current_config[key] = new_settings[key]
     if save_config(current_config):
+        _WAKE.set()  # Let the worker pick up the new schedule immediately
         return jsonify({'success': True, 'config': current_config})
     else:
         return jsonify({'error': 'Failed to save config'}), 500
@@ -430,49 +752,51 @@ def update_settings():
 def list_containers():
     if not client: return jsonify({'error': 'Docker socket not connected.'}), 500
     containers = []
-    current_hostname = socket.gethostname()
 
+    # Raw API: one request returns everything we need, no per-container inspects
     try:
-        all_containers = client.containers.list()
+        all_containers = client.api.containers(all=False)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+    try:
+        self_id = get_self_container_id()
+    except Exception as e:
+        logger.warning("Could not determine own container: %s", e)
+        self_id = None
+
     for c in all_containers:
-        try:
-            image_name = get_image_name(c)
-            if "watchtower" in image_name: continue
-            is_self = c.attrs.get('Config', {}).get('Hostname', '') == current_hostname
+        if is_updater_container(c.get('Labels')): continue
+        image_name = get_image_name(c)
+        if image_name.startswith(IGNORE_IMAGE_PREFIXES): continue
+        container_id = c['Id']
+        is_self = container_id == self_id
+
+        network_mode = (c.get('HostConfig') or {}).get('NetworkMode', '')
+        depends_on_container = network_mode.split('container:', 1)[1] if network_mode.startswith('container:') else None
+
+        names = c.get('Names') or []
+        container_data = {
+            'id': container_id,
+            'name': names[0].lstrip('/') if names else container_id[:12],
+            'image': image_name,
+            'status': c.get('State', 'unknown'),
+            'short_id': container_id[:12],
+            'is_self': is_self,
+            'depends_on_container': depends_on_container,
+            'cached_result': serialize_result(SERVER_CACHE.get(container_id))
+        }
 
-            network_mode = c.attrs.get('HostConfig', {}).get('NetworkMode', '')
-            depends_on_container = network_mode.split('container:', 1)[1] if network_mode.startswith('container:') else None
-
-            container_data = {
-                'id': c.id,
-                'name': c.name,
-                'image': image_name,
-                'status': c.status,
-                'short_id': c.short_id,
-                'is_self': is_self,
-                'depends_on_container': depends_on_container,
-                'cached_result': None
-            }
-            
-            with CACHE_LOCK:
-                if c.id in SERVER_CACHE:
-                    container_data['cached_result'] = SERVER_CACHE[c.id]
-            
-            containers.append(container_data)
-        except Exception as e:
-            continue
+        containers.append(container_data)
 
-    return jsonify(containers)
+    return json_response(containers)
 
 @app.route('/api/check/<container_id>', methods=['POST'])
 def check_update(container_id):
     if not client: return jsonify({'error': 'No docker connection'}), 500
     try:
-        result = perform_single_check(container_id)
-        return jsonify(result)
+        result = perform_single_check(container_id, force=True)
+        return jsonify(serialize_result(result))
     except Exception as e:
         logger.error(f"Check failed: {e}")
         return jsonify({'error': str(e)}), 500